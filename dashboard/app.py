@@ -1,20 +1,321 @@
 import os
+import sys
+import atexit
+import signal
+import hmac
+import hashlib
+import time
+import uuid
+import json
 import functools
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock, Thread
+from cachetools import TTLCache
+from flask import Flask, render_template, stream_template, request, redirect, url_for, session, jsonify, flash, get_flashed_messages
+from flask.json.provider import DefaultJSONProvider
+from flask.sessions import SecureCookieSessionInterface
+from jinja2 import FileSystemBytecodeCache
 from dotenv import load_dotenv
-from docker_manager import N8NManager
+from docker_manager import N8NManager, parse_version
+
+try:
+    import orjson
+except ImportError:  # orjson has no PyPy build; fall back to the stdlib encoder there
+    orjson = None
+
+# Load environment variables from .env for local development; in the container
+# the environment is set by Docker, so skip the filesystem search for .env
+if os.getenv("FLASK_ENV") != "production":
+    load_dotenv()
+
+# Configuration is read once at import; the environment can't change under a running process
+SECRET_KEY = os.getenv("SECRET_KEY", "change-me-in-production")
+CONTAINER_NAME = os.getenv("N8N_CONTAINER_NAME", "n8n")
+DASHBOARD_PW = os.getenv("DASHBOARD_PASSWORD", "").strip().encode()
+PW_CONFIGURED = bool(DASHBOARD_PW) and DASHBOARD_PW != b"your-secure-password"
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which is much faster than the stdlib encoder."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # Skip the bytes -> str -> bytes round trip of the default implementation
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, default=self.default), mimetype=self.mimetype)
+
+
+class Sha256SessionInterface(SecureCookieSessionInterface):
+    """Session cookies signed with HMAC-SHA256 (hardware accelerated on modern CPUs) instead of SHA-1."""
+    digest_method = staticmethod(hashlib.sha256)
+
+
+def dumps_bytes(obj):
+    """Serialize obj to compact JSON bytes, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
 
-# Load environment variables
-load_dotenv()
 
 app = Flask(__name__)
-app.secret_key = os.getenv("SECRET_KEY", "change-me-in-production")
+if orjson is not None:
+    app.json = OrjsonProvider(app)
+app.session_interface = Sha256SessionInterface()
+app.secret_key = SECRET_KEY
 app.config["SESSION_COOKIE_HTTPONLY"] = True
 app.config["SESSION_COOKIE_SAMESITE"] = "Lax"
 
+# Keep compiled templates on disk so worker restarts skip recompiling them.
+# Set through jinja_options (not jinja_env) so the environment is still created
+# lazily and template auto-reload keeps following debug mode. No directory is
+# given so Jinja uses its per-user one, created 0700 and checked for ownership:
+# the cache holds code objects, which must not come from a shared /tmp path.
+app.jinja_options = {
+    **app.jinja_options,
+    "bytecode_cache": FileSystemBytecodeCache(),
+    "cache_size": 400,
+}
+
 # Initialize n8n manager
-container_name = os.getenv("N8N_CONTAINER_NAME", "n8n")
-manager = N8NManager(container_name=container_name)
+manager = N8NManager(container_name=CONTAINER_NAME)
+
+# Shared pool for running independent (blocking) manager calls concurrently
+_pool = ThreadPoolExecutor(max_workers=4)
+
+# Short-lived caches so repeated polling doesn't hit Docker / registries on every request
+_status_cache = TTLCache(maxsize=1, ttl=2)
+_status_lock = Lock()
+_versions_cache = TTLCache(maxsize=4, ttl=60)
+_versions_lock = Lock()
+_images_cache = TTLCache(maxsize=1, ttl=10)
+_images_lock = Lock()
+
+
+def _cached(cache, lock, key, fetch, *args):
+    """Return cache[key], calling fetch(*args) to fill it on a miss."""
+    # Holding the lock during the fetch means concurrent misses share one call
+    with lock:
+        if key in cache:
+            return cache[key]
+        value = fetch(*args)
+        cache[key] = value
+        return value
+
+
+def cached_status():
+    """Container status, cached for a couple of seconds."""
+    return _cached(_status_cache, _status_lock, "status", manager.get_container_status)
+
+
+def cached_versions(limit=20):
+    """Available versions, cached for a minute."""
+    return _cached(_versions_cache, _versions_lock, limit, manager.get_available_versions, limit)
+
+
+def cached_local_images():
+    """Local images, cached for a few seconds."""
+    return _cached(_images_cache, _images_lock, "images", manager.get_local_images)
+
+
+def invalidate_caches():
+    """Drop cached results so the next request sees the effect of an action."""
+    # Available versions come from Docker Hub and don't change with container actions
+    for cache, lock in (
+        (_status_cache, _status_lock),
+        (_images_cache, _images_lock),
+    ):
+        with lock:
+            cache.clear()
+
+
+# Latest status/versions/images gathered by the background refresher. It is
+# replaced wholesale (never mutated) so a handler that reads it once sees a
+# consistent set without taking a lock.
+SNAPSHOT = None
+# The last snapshot published, kept when an action discards SNAPSHOT so the
+# versions in it can be carried over
+_last_snapshot = None
+REFRESH_INTERVAL = 2
+_refresh_now = Event()
+_stop = Event()
+
+# Docker Hub lookups can be slow or failing (each page is retried with
+# timeouts), so they run on their own: snapshots don't wait for a lookup in
+# progress, and a failed one isn't retried for VERSIONS_RETRY_INTERVAL seconds
+VERSIONS_RETRY_INTERVAL = 30
+_versions_future = None
+_versions_retry_at = 0.0
+_versions_future_lock = Lock()
+
+
+def _note_versions_failure(future):
+    """Back off further versions lookups after a failed one."""
+    global _versions_retry_at
+    if not future.cancelled() and future.exception() is not None:
+        _versions_retry_at = time.monotonic() + VERSIONS_RETRY_INTERVAL
+
+
+def start_versions_refresh():
+    """Return the current versions lookup, starting a new one unless one is running or backing off."""
+    global _versions_future
+    with _versions_future_lock:
+        future = _versions_future
+        if future is None or (future.done() and time.monotonic() >= _versions_retry_at):
+            future = _pool.submit(cached_versions, 20)
+            future.add_done_callback(_note_versions_failure)
+            _versions_future = future
+        return future
+
+
+def start_refresh():
+    """Start the status, versions and local images lookups and return their futures."""
+    # The three lookups are independent Docker/registry round trips, so run
+    # them concurrently: latency becomes max-of-three instead of sum-of-three
+    return {
+        "status": _pool.submit(cached_status),
+        "versions": start_versions_refresh(),
+        "local_images": _pool.submit(cached_local_images),
+    }
+
+
+def finish_refresh(futures, wait_for_versions=False):
+    """
+    Wait for lookups started by start_refresh() and publish them as the new snapshot.
+    
+    Unless wait_for_versions is set, a versions lookup still in progress doesn't hold
+    the snapshot back: the previous snapshot's versions (or error) are carried over,
+    or versions is None with no error if there has never been a result.
+    """
+    global SNAPSHOT, _last_snapshot
+    previous = _last_snapshot
+    snapshot = {"ts": time.time(), "errors": {}}
+    for key, future in futures.items():
+        if key == "versions" and not wait_for_versions and not future.done():
+            continue
+        try:
+            snapshot[key] = future.result()
+        except Exception as e:
+            snapshot[key] = None
+            snapshot["errors"][key] = str(e)
+    
+    if "versions" not in snapshot:
+        snapshot["versions"] = previous["versions"] if previous is not None else None
+        if previous is not None and "versions" in previous["errors"]:
+            snapshot["errors"]["versions"] = previous["errors"]["versions"]
+    
+    # is_latest is now set by get_available_versions based on GitHub releases
+    # Ensure all versions have is_latest set (default to False if not set)
+    for version in snapshot["versions"] or []:
+        if "is_latest" not in version:
+            version["is_latest"] = False
+    
+    # Serialize status once per refresh instead of on every /api/status poll
+    if snapshot["status"] is not None:
+        snapshot["status_body"] = dumps_bytes(snapshot["status"])
+    
+    # Serialize versions once per change (the list object is reused while the
+    # TTL cache holds it) so /api/versions can answer with a precomputed ETag
+    versions = snapshot["versions"]
+    if versions is not None:
+        if previous is not None and previous["versions"] is versions:
+            snapshot["versions_body"] = previous["versions_body"]
+            snapshot["versions_etag"] = previous["versions_etag"]
+        else:
+            snapshot["versions_body"] = dumps_bytes(versions)
+            snapshot["versions_etag"] = hashlib.blake2b(snapshot["versions_body"], digest_size=8).hexdigest()
+    
+    SNAPSHOT = _last_snapshot = snapshot
+    return snapshot
+
+
+def has_versions(snapshot):
+    """Whether snapshot holds a versions lookup outcome (a list or an error)."""
+    return snapshot["versions"] is not None or "versions" in snapshot["errors"]
+
+
+def refresh_snapshot(wait_for_versions=False):
+    """Fetch status, versions and local images concurrently and publish a new snapshot."""
+    return finish_refresh(start_refresh(), wait_for_versions)
+
+
+def current_snapshot():
+    """Return the latest snapshot, building one synchronously if none is available yet."""
+    snapshot = SNAPSHOT
+    if snapshot is None:
+        snapshot = refresh_snapshot()
+    return snapshot
+
+
+def snapshot_value(key, snapshot=None):
+    """Return one entry of a snapshot (the current one by default), re-raising the error recorded for it."""
+    if snapshot is None:
+        snapshot = current_snapshot()
+    if key in snapshot["errors"]:
+        raise Exception(snapshot["errors"][key])
+    return snapshot[key]
+
+
+def request_refresh():
+    """Discard cached state after an action and wake the refresher."""
+    global SNAPSHOT
+    invalidate_caches()
+    SNAPSHOT = None
+    _refresh_now.set()
+
+
+def _refresher():
+    """Keep SNAPSHOT fresh so request handlers never wait on Docker."""
+    while not _stop.is_set():
+        try:
+            refresh_snapshot()
+        except RuntimeError:
+            # The worker pool refuses new work once the interpreter is exiting
+            break
+        except Exception:
+            app.logger.exception("Background refresh failed")
+        _refresh_now.wait(REFRESH_INTERVAL)
+        _refresh_now.clear()
+
+
+def begin_shutdown():
+    """Stop the background refresher and end status streams so open requests can finish."""
+    _stop.set()
+    _refresh_now.set()
+
+
+def shutdown():
+    """Stop the background refresher and close the Docker connections."""
+    begin_shutdown()
+    manager.close()
+
+
+# Runs when a gunicorn worker exits (it calls sys.exit) as well as for the dev server.
+# gunicorn only exits once in-flight requests are done, so gunicorn.conf.py also
+# calls begin_shutdown() on SIGTERM to end the never-finishing status streams
+atexit.register(shutdown)
+
+
+_refresher_started = False
+_refresher_lock = Lock()
+
+
+@app.before_request
+def start_refresher():
+    """Start the background refresher in this process on its first request."""
+    # Started lazily rather than at import: a thread started in a preloading
+    # gunicorn master would not survive the fork into the workers
+    global _refresher_started
+    if _refresher_started:
+        return
+    with _refresher_lock:
+        if not _refresher_started:
+            Thread(target=_refresher, name="snapshot-refresher", daemon=True).start()
+            _refresher_started = True
 
 
 def login_required(f):
@@ -27,17 +328,29 @@ def login_required(f):
     return decorated_function
 
 
+def json_errors(f):
+    """Decorator to turn unhandled exceptions in API routes into a JSON 500 response."""
+    @functools.wraps(f)
+    def decorated_function(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except Exception as e:
+            app.logger.exception("Error handling %s", request.path)
+            return jsonify({"error": str(e)}), 500
+    return decorated_function
+
+
 @app.route("/login", methods=["GET", "POST"])
 def login():
     """Handle login page."""
     if request.method == "POST":
         password = request.form.get("password", "").strip()
-        expected_password = os.getenv("DASHBOARD_PASSWORD", "").strip()
         
         # Check if password is configured
-        if not expected_password or expected_password == "your-secure-password":
+        if not PW_CONFIGURED:
             flash("Password not configured. Please set DASHBOARD_PASSWORD in your .env file and restart the container.", "error")
-        elif password == expected_password:
+        # Constant-time comparison so response timing doesn't leak the password
+        elif hmac.compare_digest(password.encode(), DASHBOARD_PW):
             session["authenticated"] = True
             session.permanent = True
             return redirect(url_for("dashboard"))
@@ -59,205 +372,303 @@ def logout():
 @login_required
 def dashboard():
     """Main dashboard page."""
-    try:
-        status = manager.get_container_status()
-        versions = manager.get_available_versions(limit=20)
-        # is_latest is now set by get_available_versions based on GitHub releases
-        # Ensure all versions have is_latest set (default to False if not set)
-        for version in versions:
-            if "is_latest" not in version:
-                version["is_latest"] = False
-        local_images = manager.get_local_images()
-    except Exception as e:
-        flash(f"Error loading dashboard: {str(e)}", "error")
-        status = {"status": "error", "current_version": None}
-        versions = []
-        local_images = []
+    # Pop pending flash messages now: a streamed response saves the session
+    # before the template runs, so popping them later would not stick
+    get_flashed_messages()
+    
+    snapshot = SNAPSHOT
+    if snapshot is None:
+        # No data yet. Start the lookups but only wait for them when the
+        # template reaches its data block, so the page shell streams out first
+        # Only hold the page for Docker Hub if there's no earlier versions list
+        futures = start_refresh()
+        wait_for_versions = _last_snapshot is None or not has_versions(_last_snapshot)
+        load_snapshot = lambda: finish_refresh(futures, wait_for_versions)
+    elif not has_versions(snapshot):
+        # Published before the first versions lookup finished (the refresher
+        # starts on the first request, usually /login); the page never asks
+        # /api/versions itself, so wait for it here like api_versions does
+        load_snapshot = lambda: refresh_snapshot(wait_for_versions=True)
+    else:
+        load_snapshot = lambda: snapshot
     
-    return render_template(
+    return stream_template(
         "dashboard.html",
-        status=status,
-        versions=versions,
-        local_images=local_images
+        load_dashboard_data=lambda: _dashboard_data(load_snapshot())
     )
 
 
+def _dashboard_data(snapshot):
+    """Template data for the dashboard, with empty fallbacks for failed lookups."""
+    return {
+        # Each lookup fails independently, so a Docker Hub outage doesn't hide
+        # the container status (and vice versa)
+        "status": snapshot["status"] or {"status": "error", "current_version": None},
+        "versions": snapshot["versions"] or [],
+        "local_images": snapshot["local_images"] or [],
+        "errors": [f"Error loading dashboard: {error}" for error in snapshot["errors"].values()],
+    }
+
+
 @app.route("/api/status")
 @login_required
+@json_errors
 def api_status():
     """API endpoint for container status."""
-    try:
-        status = manager.get_container_status()
-        return jsonify(status)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    snapshot = current_snapshot()
+    snapshot_value("status", snapshot)
+    # Already serialized when the snapshot was built
+    return app.response_class(snapshot["status_body"], mimetype="application/json")
+
+
+@app.route("/api/status/stream")
+@login_required
+def api_status_stream():
+    """Server-Sent Events stream that pushes container status whenever it changes."""
+    def generate():
+        last_body = None
+        idle = 0
+        while not _stop.is_set():
+            snapshot = SNAPSHOT
+            body = snapshot.get("status_body") if snapshot is not None else None
+            if body is not None and body != last_body:
+                yield b"data: " + body + b"\n\n"
+                last_body = body
+                idle = 0
+            elif idle >= 15:
+                # Comment line so dead connections are noticed and closed
+                yield b": keep-alive\n\n"
+                idle = 0
+            time.sleep(1)
+            idle += 1
+    
+    return app.response_class(
+        generate(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @app.route("/api/versions")
 @login_required
+@json_errors
 def api_versions():
     """API endpoint for available versions."""
-    try:
-        versions = manager.get_available_versions(limit=20)
-        # is_latest is now set by get_available_versions based on GitHub releases
-        # Ensure all versions have is_latest set (default to False if not set)
-        for version in versions:
-            if "is_latest" not in version:
-                version["is_latest"] = False
-        return jsonify(versions)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    snapshot = current_snapshot()
+    if not has_versions(snapshot):
+        # The first lookup hasn't finished yet; wait for it rather than answer empty
+        snapshot = refresh_snapshot(wait_for_versions=True)
+    snapshot_value("versions", snapshot)
+    response = app.response_class(snapshot["versions_body"], mimetype="application/json")
+    # Versions rarely change, so pollers revalidate with If-None-Match and get a 304
+    response.set_etag(snapshot["versions_etag"])
+    return response.make_conditional(request)
 
 
 @app.route("/api/local-images")
 @login_required
+@json_errors
 def api_local_images():
     """API endpoint for local images."""
-    try:
-        local_images = manager.get_local_images()
-        return jsonify(local_images)
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    local_images = snapshot_value("local_images")
+    return jsonify(local_images)
 
 
 @app.route("/api/check-update")
 @login_required
+@json_errors
 def api_check_update():
     """API endpoint to check if a new stable version is available."""
+    status = snapshot_value("status")
+    current_version = status.get("current_version")
+    
+    if not current_version:
+        return jsonify({
+            "update_available": False,
+            "message": "Current version unknown"
+        })
+    
+    # Get latest production version from GitHub (cached by the manager)
     try:
-        status = manager.get_container_status()
-        current_version = status.get("current_version")
-        
-        if not current_version:
-            return jsonify({
-                "update_available": False,
-                "message": "Current version unknown"
-            })
-        
-        # Get latest production version from GitHub
-        try:
-            import requests
-            response = requests.get(
-                "https://api.github.com/repos/n8n-io/n8n/releases/latest",
-                timeout=5
-            )
-            if response.status_code == 200:
-                latest_release = response.json()
-                latest_tag = latest_release.get("tag_name", "")
+        latest_version = manager.get_latest_release_version()
+        if latest_version:
+            # Compare versions using semver (memoized; both strings repeat across checks)
+            try:
+                current_semver = parse_version(current_version)
+                latest_semver = parse_version(latest_version)
                 
-                # Strip 'v' and 'n8n@' prefixes if present
-                latest_version = latest_tag.replace("v", "").replace("n8n@", "")
+                update_available = latest_semver > current_semver
                 
-                # Compare versions using semver
-                import semver
-                try:
-                    current_semver = semver.Version.parse(current_version)
-                    latest_semver = semver.Version.parse(latest_version)
-                    
-                    update_available = latest_semver > current_semver
-                    
-                    return jsonify({
-                        "update_available": update_available,
-                        "current_version": current_version,
-                        "latest_version": latest_version,
-                        "message": f"New version {latest_version} available!" if update_available else f"You're running the latest version ({current_version})"
-                    })
-                except ValueError:
-                    # Version parsing failed, can't compare
-                    return jsonify({
-                        "update_available": False,
-                        "message": "Unable to compare versions"
-                    })
-            else:
+                return jsonify({
+                    "update_available": update_available,
+                    "current_version": current_version,
+                    "latest_version": latest_version,
+                    "message": f"New version {latest_version} available!" if update_available else f"You're running the latest version ({current_version})"
+                })
+            except ValueError:
+                # Version parsing failed, can't compare
                 return jsonify({
                     "update_available": False,
-                    "message": "Failed to check for updates"
+                    "message": "Unable to compare versions"
                 })
-        except Exception as e:
+        else:
             return jsonify({
                 "update_available": False,
-                "message": f"Error checking for updates: {str(e)}"
+                "message": "Failed to check for updates"
             })
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        return jsonify({
+            "update_available": False,
+            "message": f"Error checking for updates: {str(e)}"
+        })
 
 
 @app.route("/api/check-upgrade", methods=["POST"])
 @login_required
+@json_errors
 def api_check_upgrade():
     """API endpoint for pre-upgrade checks."""
+    data = request.get_json()
+    target_version = data.get("target_version")
+    
+    if not target_version:
+        return jsonify({"error": "target_version is required"}), 400
+    
+    checks = manager.pre_upgrade_checks(target_version)
+    return jsonify(checks)
+
+
+# Upgrades and rollbacks run in the background so the request returns
+# immediately. One worker so two of them can never touch the container at the
+# same time.
+_upgrade_executor = ThreadPoolExecutor(max_workers=1)
+# Background jobs by id: {"status": "running"|"done"|"error", "progress", "result", "error", "finished"}
+_JOBS = {}
+# How long a finished job stays around for its page to pick up the outcome
+JOB_RETENTION = 3600
+
+
+def _run_job(job_id, work):
+    """Run work(report) for a background job, recording its progress and outcome."""
+    job = _JOBS[job_id]
+    
+    def report(message):
+        job["progress"] = message
+    
     try:
-        data = request.get_json()
-        target_version = data.get("target_version")
-        
-        if not target_version:
-            return jsonify({"error": "target_version is required"}), 400
-        
-        checks = manager.pre_upgrade_checks(target_version)
-        return jsonify(checks)
+        job["result"] = work(report)
+        job["status"] = "done"
     except Exception as e:
-        return jsonify({"error": str(e)}), 500
+        job["error"] = str(e)
+        job["status"] = "error"
+    finally:
+        job["finished"] = time.time()
+        request_refresh()
+
+
+def _start_job(work):
+    """Queue work(report) on the upgrade executor and return the new job's id."""
+    # Drop jobs whose outcome has had plenty of time to be read so _JOBS stays small
+    cutoff = time.time() - JOB_RETENTION
+    for old_id, old_job in list(_JOBS.items()):
+        if old_job["finished"] is not None and old_job["finished"] < cutoff:
+            _JOBS.pop(old_id, None)
+    
+    job_id = uuid.uuid4().hex
+    _JOBS[job_id] = {"status": "running", "progress": "Queued...", "result": None, "error": None, "finished": None}
+    _upgrade_executor.submit(_run_job, job_id, work)
+    return job_id
+
+
+def _upgrade(target_version, report):
+    """Back up the n8n volume and upgrade to target_version."""
+    # Create backup before upgrade
+    report("Creating backup...")
+    backup_filename = manager.backup_volume()
+    
+    # Perform upgrade
+    container_id = manager.update_to_version(target_version, callback=report)
+    
+    return {
+        "success": True,
+        "backup_filename": backup_filename,
+        "container_id": container_id
+    }
+
+
+def _rollback(report):
+    """Roll back to the previous local image."""
+    container_id = manager.rollback_to_previous(callback=report)
+    return {
+        "success": True,
+        "container_id": container_id
+    }
 
 
 @app.route("/api/update", methods=["POST"])
 @login_required
+@json_errors
 def api_update():
-    """API endpoint for updating n8n version."""
-    try:
-        data = request.get_json()
-        target_version = data.get("target_version")
-        
-        if not target_version:
-            return jsonify({"error": "target_version is required"}), 400
-        
-        # Create backup before upgrade
-        backup_filename = manager.backup_volume()
-        
-        # Perform upgrade
-        container_id = manager.update_to_version(target_version)
-        
-        return jsonify({
-            "success": True,
-            "backup_filename": backup_filename,
-            "container_id": container_id
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    """API endpoint for updating n8n version; starts a background job."""
+    data = request.get_json()
+    target_version = data.get("target_version")
+    
+    if not target_version:
+        return jsonify({"error": "target_version is required"}), 400
+    
+    job_id = _start_job(functools.partial(_upgrade, target_version))
+    return jsonify({"job_id": job_id}), 202
+
+
+@app.route("/api/jobs/<job_id>")
+@login_required
+@json_errors
+def api_job(job_id):
+    """API endpoint for the status of a background job."""
+    job = _JOBS.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+    return jsonify(job)
 
 
 @app.route("/api/rollback", methods=["POST"])
 @login_required
+@json_errors
 def api_rollback():
-    """API endpoint for rolling back to previous version."""
-    try:
-        container_id = manager.rollback_to_previous()
-        return jsonify({
-            "success": True,
-            "container_id": container_id
-        })
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    """API endpoint for rolling back to previous version; starts a background job."""
+    # Same queue as upgrades so a rollback never overlaps one
+    job_id = _start_job(_rollback)
+    return jsonify({"job_id": job_id}), 202
+
+
+# Container control actions by URL name
+_CONTROL_ACTIONS = {
+    "start": lambda: manager.start_container(),
+    "stop": lambda: manager.stop_container(),
+    "restart": lambda: manager.restart_container(),
+}
 
 
 @app.route("/api/control/<action>", methods=["POST"])
 @login_required
+@json_errors
 def api_control(action):
     """API endpoint for container control (start, stop, restart)."""
+    control = _CONTROL_ACTIONS.get(action)
+    if control is None:
+        return jsonify({"error": "Invalid action"}), 400
+    
     try:
-        if action == "start":
-            manager.start_container()
-        elif action == "stop":
-            manager.stop_container()
-        elif action == "restart":
-            manager.restart_container()
-        else:
-            return jsonify({"error": "Invalid action"}), 400
-        
+        control()
         return jsonify({"success": True})
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    finally:
+        request_refresh()
 
 
 if __name__ == "__main__":
+    # Development server only; production runs gunicorn with gevent workers (see wsgi.py).
+    # gunicorn installs its own SIGTERM handling, so only convert it to a normal
+    # exit (running the atexit shutdown) here
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
     app.run(host="0.0.0.0", port=8080, debug=True)
 
@@ -1,8 +1,221 @@
+import os
+import json
+import functools
+import math
+import re
+import tempfile
+import threading
+import time
 import docker
 import requests
 import semver
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, List, Optional, Callable
+from operator import itemgetter
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Callable, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson has no PyPy build; fall back to the stdlib decoder there
+    orjson = None
+
+# Pooled connections to the Docker daemon, enough for the dashboard's background
+# refresher, its worker pool and concurrent requests to all reuse keep-alive connections
+DOCKER_POOL_SIZE = 20
+# Bound on ordinary Docker API calls; docker-py extends it for stop/restart by the
+# stop timeout and doesn't apply it to image pulls
+DOCKER_TIMEOUT = 30
+
+# How long a container status read is reused; the dashboard polls it every few seconds
+STATUS_CACHE_TTL = 2
+
+# (connect, read) timeouts for Docker Hub and GitHub requests
+HTTP_TIMEOUT = (3, 10)
+
+GITHUB_LATEST_RELEASE_URL = "https://api.github.com/repos/n8n-io/n8n/releases/latest"
+# How long a GitHub API response is reused before it is revalidated
+GITHUB_CACHE_TTL = 15 * 60
+
+HUB_TAGS_URL = "https://hub.docker.com/v2/repositories/n8nio/n8n/tags"
+HUB_PAGE_SIZE = 100
+# Tag pages fetched in parallel once the first page has told us how many exist
+HUB_PAGE_BATCH = 4
+
+# Architecture-specific (amd64, arm64) and pre-release (experimental, alpha, beta, rc)
+# tags; only base production versions are offered
+_TAG_REJECT_RE = re.compile(r"-amd64|-arm64|[-.]exp|[-.]alpha|[-.]beta|[-.]rc", re.IGNORECASE)
+# Tags made only of numbers separated by dots or dashes (1.2.3, 1.2.3-1), i.e. versions
+_NUMERIC_TAG_RE = re.compile(r"^[0-9]+(?:[.\-][0-9]+)*$")
+# Docker's RFC 3339 timestamps: whole seconds, then an optional fraction of varying length
+_CREATED_RE = re.compile(r"^(\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2})(?:\.(\d+))?")
+# Semver-shaped tags; anything else (sha-..., nightly, ...) is dropped without
+# the semver parse, which would raise for each of them
+_SEMVER_RE = re.compile(r"^\d+\.\d+\.\d+(?:-[0-9A-Za-z.-]+)?(?:\+[0-9A-Za-z.-]+)?$")
+
+# How long the assembled Docker Hub version list is reused
+VERSIONS_CACHE_TTL = 15 * 60
+# Version lists and GitHub responses are also kept on disk so a restarted dashboard
+# starts warm; point CACHE_DIR at a volume to keep them across container recreation
+CACHE_DIR = os.getenv("CACHE_DIR", tempfile.gettempdir())
+VERSIONS_CACHE_FILE = os.path.join(CACHE_DIR, "n8n_versions.json")
+GITHUB_CACHE_FILE = os.path.join(CACHE_DIR, "github_responses.json")
+
+
+def _load_json_cache(path: str) -> dict:
+    """Load a cache persisted by a previous process, or {} if there is none."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def _save_json_cache(path: str, data: dict):
+    """Persist a cache atomically; failures only cost a cold start later."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except Exception:
+        pass
+
+
+# GitHub API responses by URL: [expires_at, etag, payload]; expiry is wall-clock
+# time so entries loaded from disk after a restart stay meaningful
+_GH_CACHE: Dict[str, Tuple[float, Optional[str], dict]] = _load_json_cache(GITHUB_CACHE_FILE)
+_GH_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=2048)
+def parse_version(version: str) -> semver.Version:
+    """
+    Memoized semver.Version.parse.
+    
+    The same strings (current version, target version, recent tags) are parsed
+    again on every refresh. Callers must not mutate the returned Version.
+    """
+    return semver.Version.parse(version)
+
+
+def _fast_parse(version: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a plain X.Y.Z version into a (major, minor, patch) tuple.
+    
+    Tuples compare the same way semver does for release versions, without the
+    cost of a full parse. Returns None for anything else (pre-release or build
+    suffixes, non-numeric parts), which callers hand to parse_version.
+    """
+    # Only accept what semver would: ASCII digits without leading zeros. This
+    # rejects what int() would quietly accept (signs, whitespace, other scripts'
+    # digits) and avoids raising for every tag that isn't plain X.Y.Z
+    parts = version.split(".")
+    if len(parts) != 3 or not all(
+        part.isascii() and part.isdecimal() and (len(part) == 1 or part[0] != "0")
+        for part in parts
+    ):
+        return None
+    return int(parts[0]), int(parts[1]), int(parts[2])
+
+
+def _version_key(version: str) -> Tuple[int, int, int]:
+    """
+    (major, minor, patch) tuple for comparing versions.
+    
+    Raises:
+        ValueError: If version is not valid semver
+    """
+    parsed = _fast_parse(version)
+    if parsed is None:
+        version_obj = parse_version(version)
+        parsed = (version_obj.major, version_obj.minor, version_obj.patch)
+    return parsed
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_client() -> docker.DockerClient:
+    """
+    Docker client shared by every N8NManager in the process.
+    
+    Managers created per request or per job then reuse one set of pooled
+    connections to the daemon instead of each dialling their own.
+    """
+    client = docker.from_env(max_pool_size=DOCKER_POOL_SIZE, timeout=DOCKER_TIMEOUT)
+    # docker-py sizes its own unix-socket/TLS adapters, but a plain
+    # tcp:// DOCKER_HOST (the socket proxy) uses requests' default pool of 10
+    if client.api.base_url.startswith("http://"):
+        client.api.mount("http://", HTTPAdapter(pool_maxsize=DOCKER_POOL_SIZE))
+    return client
+
+
+def _response_json(response: requests.Response):
+    """Decode a JSON response body, with orjson when it is available."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _created_key(created: str) -> Tuple[str, float]:
+    """
+    Sort key for an image's "Created" timestamp.
+    
+    Docker trims trailing zeros from the fraction, so the raw strings don't compare
+    correctly within the same second ("...05Z" vs "...05.1Z"); the fraction is
+    compared as a number instead. Unparseable values sort last.
+    """
+    match = _CREATED_RE.match(created)
+    if not match:
+        return "", 0.0
+    seconds, fraction = match.groups()
+    return seconds, float(f"0.{fraction}") if fraction else 0.0
+
+
+def _github_get_json(url: str, http=requests) -> dict:
+    """
+    GET a GitHub API URL, serving repeat calls from a TTL cache.
+    
+    Once the TTL expires the request is sent with If-None-Match, so an unchanged
+    resource costs a bodiless 304 (which doesn't count against the rate limit).
+    The request goes through http, a requests.Session or the requests module.
+    """
+    # Holding the lock over the request means concurrent callers share one fetch
+    with _GH_LOCK:
+        now = time.time()
+        cached = _GH_CACHE.get(url)
+        if cached and cached[0] > now:
+            return cached[2]
+        
+        headers = {"Accept": "application/vnd.github+json"}
+        if cached and cached[1]:
+            headers["If-None-Match"] = cached[1]
+        response = http.get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        
+        if response.status_code == 304 and cached:
+            _GH_CACHE[url] = (now + GITHUB_CACHE_TTL, cached[1], cached[2])
+            _save_json_cache(GITHUB_CACHE_FILE, _GH_CACHE)
+            return cached[2]
+        
+        response.raise_for_status()
+        payload = _response_json(response)
+        _GH_CACHE[url] = (now + GITHUB_CACHE_TTL, response.headers.get("ETag"), payload)
+        _save_json_cache(GITHUB_CACHE_FILE, _GH_CACHE)
+        return payload
+
+
+@dataclass(slots=True)
+class ContainerSnapshot:
+    """Settings carried over from an existing n8n container to its replacement."""
+    # {container_port: host_port}, as create_host_config takes them
+    port_bindings: Dict[int, int] = field(default_factory=dict)
+    # {volume_name: mount_point}
+    binds: Dict[str, str] = field(default_factory=dict)
+    env: Dict[str, str] = field(default_factory=dict)
+    # First attached network, usually the main one
+    network: Optional[str] = None
 
 
 class N8NManager:
@@ -10,176 +223,322 @@ class N8NManager:
         """Initialize the n8n manager with Docker client."""
         self.container_name = container_name
         self._client = None
+        self._client_lock = threading.Lock()
+        # ID of the n8n container once resolved, so later lookups skip name resolution
+        self._container_id: Optional[str] = None
+        # n8n versions by image ID, resolved from tags or labels
+        self._image_versions: Dict[str, str] = {}
+        # Network IDs by the network name recorded on the old container, from past upgrades
+        self._network_ids: Dict[str, str] = {}
         self.image_name = "n8nio/n8n"
+        # Version lists by limit: {limit: (expires_at, versions)}; expiry is wall-clock
+        # time so entries loaded from disk after a restart stay meaningful
+        self._versions_cache: Dict[int, Tuple[float, List[Dict[str, str]]]] = self._load_versions_cache()
+        self._versions_lock = threading.Lock()
+        # Worker threads for independent blocking calls (e.g. parallel page fetches)
+        self._pool = ThreadPoolExecutor(max_workers=HUB_PAGE_BATCH)
+        # Docker Hub tag pages by page number: (etag, payload), for conditional requests
+        self._hub_pages: Dict[int, Tuple[str, Dict]] = {}
+        # Keep-alive HTTPS connections to Docker Hub and GitHub, shared by the page
+        # fetches; transient errors and rate limiting are retried with backoff
+        self._http = requests.Session()
+        self._http.mount("https://", HTTPAdapter(
+            pool_connections=2,
+            pool_maxsize=HUB_PAGE_BATCH * 2,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504])
+        ))
+        # Last status read: (expires_at, status); cleared by anything that changes the container
+        self._status_cache: Optional[Tuple[float, Dict]] = None
+        # Usage figures from the latest sample of a background stats stream, reduced
+        # as samples arrive so status reads neither block nor redo the arithmetic
+        self._latest_usage: Optional[Tuple] = None
+        self._stats_container_id: Optional[str] = None
+        self._stats_thread: Optional[threading.Thread] = None
+        self._stats_stop = threading.Event()
+        self._stats_lock = threading.Lock()
+        # (total_usage, system_cpu_usage) of the last sample, for deltas when a
+        # sample's own precpu_stats are empty
+        self._prev_cpu: Optional[Tuple[int, int]] = None
+        # CPUs available to the container, from its first stats sample
+        self._num_cpus: Optional[int] = None
     
     @property
     def client(self):
         """Lazy initialization of Docker client."""
         if self._client is None:
-            try:
-                # Initialize client without immediate ping to avoid build-time errors
-                self._client = docker.from_env()
-                # Only test connection when actually needed (at runtime)
-            except Exception as e:
-                raise Exception(f"Failed to connect to Docker: {str(e)}. Make sure Docker Desktop is running.")
+            # Several threads may ask for the client at once; only build one
+            with self._client_lock:
+                if self._client is None:
+                    try:
+                        # Initialize client without immediate ping to avoid build-time errors
+                        self._client = _shared_client()
+                        # Only test connection when actually needed (at runtime)
+                    except Exception as e:
+                        raise Exception(f"Failed to connect to Docker: {str(e)}. Make sure Docker Desktop is running.")
         return self._client
 
-    def get_available_versions(self, limit: int = 20) -> List[Dict[str, str]]:
+    def close(self):
+        """Close the Docker client, the HTTP session and their pooled connections."""
+        self._stop_stats_stream()
+        self._http.close()
+        with self._client_lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+                _shared_client.cache_clear()
+
+    def _get_container(self):
+        """
+        Get the n8n container, looking it up by cached ID when possible.
+        
+        Raises:
+            docker.errors.NotFound: If no container with container_name exists
+        """
+        container_id = self._container_id
+        if container_id:
+            try:
+                return self.client.containers.get(container_id)
+            except docker.errors.NotFound:
+                # Replaced since we last looked (e.g. recreated by compose)
+                self._container_id = None
+        container = self.client.containers.get(self.container_name)
+        self._container_id = container.id
+        return container
+
+    def get_latest_release_version(self) -> Optional[str]:
+        """
+        Get the latest production n8n release from GitHub.
+        
+        Returns:
+            Version string (e.g. "1.121.3"), or None if the latest release is a pre-release
+        """
+        latest_release = _github_get_json(GITHUB_LATEST_RELEASE_URL, self._http)
+        tag_name = latest_release.get("tag_name", "")
+        # Remove 'n8n@' prefix if present (e.g., "n8n@1.121.3" -> "1.121.3")
+        if tag_name.startswith("n8n@"):
+            tag_name = tag_name[4:]
+        # Remove 'v' prefix if present (e.g., "v1.121.3" -> "1.121.3")
+        if tag_name.startswith("v"):
+            tag_name = tag_name[1:]
+        # Only use if it's not a pre-release
+        if latest_release.get("prerelease", False):
+            return None
+        return tag_name
+
+    @staticmethod
+    def _load_versions_cache() -> Dict[int, Tuple[float, List[Dict[str, str]]]]:
+        """Load version lists persisted by a previous process, if any."""
+        try:
+            data = _load_json_cache(VERSIONS_CACHE_FILE)
+            return {int(limit): (expires_at, versions) for limit, (expires_at, versions) in data.items()}
+        except Exception:
+            return {}
+
+    def _save_versions_cache(self):
+        """Persist the version lists."""
+        _save_json_cache(VERSIONS_CACHE_FILE, self._versions_cache)
+
+    def get_available_versions(self, limit: int = 20, force_refresh: bool = False) -> List[Dict[str, str]]:
         """
         Fetch available n8n versions from Docker Hub and GitHub releases.
         
+        Results are cached for VERSIONS_CACHE_TTL seconds.
+        
         Args:
             limit: Maximum number of versions to return
+            force_refresh: Bypass the cache and fetch from Docker Hub
             
         Returns:
             List of dicts with 'version', 'updated', and 'is_latest' keys, sorted newest first
         """
+        if not force_refresh:
+            cached = self._cached_versions(limit)
+            if cached is not None:
+                return cached
+        
+        # Concurrent misses wait for the first fetch instead of repeating it
+        with self._versions_lock:
+            cached = None if force_refresh else self._cached_versions(limit)
+            if cached is not None:
+                return cached
+            versions = self._fetch_available_versions(limit)
+            self._versions_cache[limit] = (time.time() + VERSIONS_CACHE_TTL, versions)
+            self._save_versions_cache()
+            return versions
+
+    def _cached_versions(self, limit: int) -> Optional[List[Dict[str, str]]]:
+        """
+        Return a fresh cached version list covering limit, or None.
+        
+        A list cached for a larger limit is trimmed rather than fetched again.
+        """
+        now = time.time()
+        cached = self._versions_cache.get(limit)
+        if cached and cached[0] > now:
+            # Same list object on an exact hit, so callers can tell nothing changed
+            return cached[1]
+        for cached_limit, (expires_at, versions) in list(self._versions_cache.items()):
+            if cached_limit > limit and expires_at > now:
+                return versions[:limit]
+        return None
+
+    def _fetch_available_versions(self, limit: int) -> List[Dict[str, str]]:
+        """Fetch the version list from Docker Hub, marking GitHub's latest release."""
         try:
-            # First, get the latest production release from GitHub
-            latest_production_version = None
-            try:
-                github_response = requests.get(
-                    "https://api.github.com/repos/n8n-io/n8n/releases/latest",
-                    headers={"Accept": "application/vnd.github+json"},
-                    timeout=5
-                )
-                if github_response.status_code == 200:
-                    latest_release = github_response.json()
-                    tag_name = latest_release.get("tag_name", "")
-                    # Remove 'n8n@' prefix if present (e.g., "n8n@1.121.3" -> "1.121.3")
-                    if tag_name.startswith("n8n@"):
-                        tag_name = tag_name[4:]
-                    # Remove 'v' prefix if present (e.g., "v1.121.3" -> "1.121.3")
-                    if tag_name.startswith("v"):
-                        tag_name = tag_name[1:]
-                    # Only use if it's not a pre-release
-                    if not latest_release.get("prerelease", False):
-                        latest_production_version = tag_name
-            except Exception:
-                # If GitHub API fails, continue without latest marker
-                pass
+            # Look up the latest production release on GitHub while Docker Hub is walked
+            latest_future = self._pool.submit(self.get_latest_release_version)
             
-            # Fetch versions from Docker Hub
-            url = "https://hub.docker.com/v2/repositories/n8nio/n8n/tags"
-            params = {"page_size": 100}
-            versions = []
+            # Fetch versions from Docker Hub. Each page holds at most HUB_PAGE_SIZE
+            # releases, so the pages limit needs at minimum are fetched together up
+            # front; the first one says how many pages there are, and any further
+            # pages are then fetched a batch at a time in parallel
+            tags = []
+            first_pages = range(1, max(1, math.ceil(limit / HUB_PAGE_SIZE)) + 1)
+            page_count = None
+            done = False
+            for data in self._pool.map(self._fetch_hub_page, first_pages):
+                if page_count is None:
+                    page_count = math.ceil(data.get("count", 0) / HUB_PAGE_SIZE)
+                if not done:
+                    done = self._collect_release_tags(data.get("results", []), tags, limit)
             
-            while len(versions) < limit:
-                response = requests.get(url, params=params)
-                response.raise_for_status()
-                data = response.json()
-                
-                for tag in data.get("results", []):
-                    tag_name = tag.get("name", "")
-                    
-                    # Skip non-semver tags
-                    if tag_name in ["latest", "next"]:
-                        continue
-                    
-                    # Skip architecture-specific tags (amd64, arm64, etc.)
-                    # Only include base versions without architecture suffixes
-                    if any(arch in tag_name for arch in ["-amd64", "-arm64"]):
-                        continue
-                    
-                    # Skip pre-release versions (experimental, alpha, beta, rc)
-                    # Only include production releases
-                    if any(pre in tag_name.lower() for pre in ["-exp.", "-exp", ".exp", "-alpha", "-beta", "-rc", ".alpha", ".beta", ".rc"]):
-                        continue
-                    
-                    # Validate semver and ensure it's a production release
-                    try:
-                        version_obj = semver.Version.parse(tag_name)
-                        # Skip if it's a pre-release version (has prerelease component)
-                        if version_obj.prerelease:
-                            continue
-                        updated = tag.get("last_updated", "")
-                        versions.append({
-                            "version": tag_name,
-                            "updated": updated,
-                            "is_latest": False  # Will be set below based on GitHub
-                        })
-                    except ValueError:
-                        continue
-                    
-                    if len(versions) >= limit:
+            next_page = first_pages.stop
+            while not done and next_page <= page_count:
+                batch = range(next_page, min(next_page + HUB_PAGE_BATCH, page_count + 1))
+                # map() yields pages in order, so results match a sequential walk
+                for data in self._pool.map(self._fetch_hub_page, batch):
+                    done = self._collect_release_tags(data.get("results", []), tags, limit)
+                    if done:
                         break
-                
-                # Check for next page
-                if data.get("next"):
-                    url = data["next"]
-                    params = {}
-                else:
-                    break
+                next_page = batch.stop
             
-            # Sort by version descending (newest first)
-            versions.sort(key=lambda x: semver.Version.parse(x["version"]), reverse=True)
+            # Sort by version descending (newest first), reusing the versions parsed while filtering
+            tags.sort(key=itemgetter(0), reverse=True)
+            versions = [
+                {
+                    "version": tag_name,
+                    "updated": updated,
+                    "is_latest": False  # Will be set below based on GitHub
+                }
+                for _, tag_name, updated in tags[:limit]
+            ]
             
             # Mark the latest production version from GitHub
+            try:
+                latest_production_version = latest_future.result()
+            except Exception:
+                # If GitHub API fails, continue without latest marker
+                latest_production_version = None
             if latest_production_version:
                 for version in versions:
                     if version["version"] == latest_production_version:
                         version["is_latest"] = True
                         break
             
-            return versions[:limit]
+            return versions
         except Exception as e:
             raise Exception(f"Failed to fetch versions: {str(e)}")
 
+    def _fetch_hub_page(self, page: int) -> Dict:
+        """
+        Fetch one page of n8n image tags from Docker Hub.
+        
+        Pages are revalidated with If-None-Match, so an unchanged page costs a
+        bodiless 304. A page past the end (404) comes back empty, since pages are
+        requested before the total is known.
+        """
+        cached = self._hub_pages.get(page)
+        headers = {"If-None-Match": cached[0]} if cached else None
+        response = self._http.get(
+            HUB_TAGS_URL,
+            params={"page": page, "page_size": HUB_PAGE_SIZE},
+            headers=headers,
+            timeout=HTTP_TIMEOUT
+        )
+        if response.status_code == 304 and cached:
+            return cached[1]
+        if response.status_code == 404:
+            return {}
+        response.raise_for_status()
+        data = _response_json(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            self._hub_pages[page] = (etag, data)
+        return data
+
+    def _collect_release_tags(self, tags: List[Dict], versions: List[Tuple], limit: int) -> bool:
+        """
+        Append the production release tags from one Docker Hub page to versions.
+        
+        Tags are appended as (version_key, name, last_updated) tuples; dicts are only
+        built for the ones that survive the final sort and trim.
+        
+        Returns:
+            True once versions holds limit entries
+        """
+        # Bind the per-tag callables once; this loop runs over every tag on every page
+        append = versions.append
+        reject = _TAG_REJECT_RE.search
+        fast_parse = _fast_parse
+        is_semver = _SEMVER_RE.match
+        
+        for tag in tags:
+            tag_name = tag.get("name", "")
+            
+            # Skip non-semver tags, then architecture-specific and pre-release tags
+            # in a single regex search
+            if tag_name in ("latest", "next") or reject(tag_name):
+                continue
+            
+            # Validate semver and ensure it's a production release. Plain X.Y.Z
+            # tags can't carry a pre-release component and need no semver parse
+            version_key = fast_parse(tag_name)
+            if version_key is None:
+                if not is_semver(tag_name):
+                    continue
+                try:
+                    version_obj = parse_version(tag_name)
+                except ValueError:
+                    continue
+                # Skip if it's a pre-release version (has prerelease component)
+                if version_obj.prerelease:
+                    continue
+                version_key = (version_obj.major, version_obj.minor, version_obj.patch)
+            
+            append((version_key, tag_name, tag.get("last_updated", "")))
+            
+            if len(versions) >= limit:
+                return True
+        return False
+
     def get_container_status(self) -> Dict:
         """
         Get the current status of the n8n container.
         
+        Reads are reused for STATUS_CACHE_TTL seconds; callers must not mutate the result.
+        
         Returns:
             Dict with status, current_version, started_at, health keys
         """
+        cached = self._status_cache
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        status = self._read_container_status()
+        self._status_cache = (time.monotonic() + STATUS_CACHE_TTL, status)
+        return status
+
+    def _read_container_status(self) -> Dict:
+        """Inspect the container and build the dict returned by get_container_status."""
         try:
-            container = self.client.containers.get(self.container_name)
-            
-            # Extract version from image tags
-            image_tags = container.image.tags
-            current_version = "unknown"
-            for tag in image_tags:
-                if self.image_name in tag:
-                    # Extract version from tag like "n8nio/n8n:1.0.0"
-                    parts = tag.split(":")
-                    if len(parts) == 2:
-                        current_version = parts[1]
-                    break
-            
-            # If version is "latest", try to get actual version from image labels or inspect
-            if current_version == "latest":
-                try:
-                    image = container.image
-                    # Get labels from image attributes
-                    labels = image.attrs.get("Config", {}).get("Labels", {})
-                    # Try multiple possible label keys for version
-                    version_label = (
-                        labels.get("org.opencontainers.image.version") or
-                        labels.get("version") or
-                        labels.get("n8n.version") or
-                        labels.get("io.n8n.version")
-                    )
-                    if version_label:
-                        current_version = version_label
-                    else:
-                        # Try to get from image repo tags - sometimes latest points to a specific version
-                        # Check all tags for this image
-                        image_repo_tags = image.attrs.get("RepoTags", [])
-                        for repo_tag in image_repo_tags:
-                            if ":" in repo_tag and not repo_tag.endswith(":latest"):
-                                tag_part = repo_tag.split(":")[-1]
-                                # If it looks like a version number, use it
-                                if tag_part and tag_part.replace(".", "").replace("-", "").isdigit():
-                                    current_version = tag_part
-                                    break
-                except Exception:
-                    pass
+            container = self._get_container()
             
+            # Everything below comes from the inspect data containers.get already fetched
             status = container.status
-            started_at = container.attrs.get("State", {}).get("StartedAt", "")
+            state = container.attrs.get("State", {})
+            started_at = state.get("StartedAt", "")
             
             # Get health status - check if health check is configured
-            health_state = container.attrs.get("State", {}).get("Health", {})
+            health_state = state.get("Health", {})
             if health_state:
                 # Health check is configured, use its status
                 health = health_state.get("Status", "unknown")
@@ -203,43 +562,21 @@ class N8NManager:
             
             if status == "running":
                 try:
-                    stats = container.stats(stream=False)
-                    
-                    # Calculate CPU percentage
-                    cpu_stats = stats.get("cpu_stats", {})
-                    precpu_stats = stats.get("precpu_stats", {})
-                    
-                    if cpu_stats and precpu_stats:
-                        cpu_usage = cpu_stats.get("cpu_usage", {})
-                        precpu_usage = precpu_stats.get("cpu_usage", {})
-                        
-                        if cpu_usage and precpu_usage:
-                            cpu_delta = cpu_usage.get("total_usage", 0) - precpu_usage.get("total_usage", 0)
-                            system_delta = cpu_stats.get("system_cpu_usage", 0) - precpu_stats.get("system_cpu_usage", 0)
-                            
-                            if system_delta > 0 and cpu_delta > 0:
-                                # Get number of CPUs
-                                percpu_usage = cpu_usage.get("percpu_usage", [])
-                                num_cpus = len(percpu_usage) if percpu_usage else 1
-                                
-                                cpu_percent = (cpu_delta / system_delta) * num_cpus * 100.0
-                                cpu_percent = round(cpu_percent, 2)
-                    
-                    # Get memory usage
-                    memory_stats = stats.get("memory_stats", {})
-                    if memory_stats:
-                        memory_usage = memory_stats.get("usage", 0)
-                        memory_limit = memory_stats.get("limit", 0)
-                        
-                        if memory_limit and memory_limit > 0:
-                            memory_percent = (memory_usage / memory_limit) * 100.0
-                            memory_percent = round(memory_percent, 2)
+                    self._ensure_stats_stream(container)
+                    # The stream's first sample takes a sampling interval to arrive;
+                    # until then take a one-shot sample
+                    usage = self._latest_usage or self._usage_from_stats(self._one_shot_stats(container))
+                    cpu_percent, memory_usage, memory_limit, memory_percent = usage
                 except Exception as e:
                     # If stats fail, just continue without them
                     import logging
                     logging.warning(f"Failed to get container stats: {str(e)}")
                     pass
             
+            # Resolved inline rather than on self._pool: that pool also carries the
+            # Docker Hub and GitHub lookups, and the version is cached by image ID
+            current_version = self._current_version(container)
+            
             return {
                 "status": status,
                 "current_version": current_version,
@@ -264,6 +601,186 @@ class N8NManager:
         except Exception as e:
             raise Exception(f"Failed to get container status: {str(e)}")
 
+    @staticmethod
+    def _one_shot_stats(container) -> Dict:
+        """
+        Take a single stats sample without waiting for the daemon's sampling cycles.
+        
+        One-shot samples need Engine API 1.41+ and have zeroed precpu_stats.
+        """
+        try:
+            return container.stats(stream=False, one_shot=True)
+        except docker.errors.InvalidVersion:
+            return container.stats(stream=False)
+
+    def _usage_from_stats(self, stats: Dict) -> Tuple[Optional[float], Optional[int], Optional[int], Optional[float]]:
+        """
+        Reduce a stats sample to the figures the dashboard shows.
+        
+        Returns:
+            Tuple of (cpu_percent, memory_usage, memory_limit, memory_percent)
+        """
+        # Calculate CPU percentage
+        cpu_percent = self._cpu_percent(stats)
+        
+        # Get memory usage
+        memory_usage = None
+        memory_limit = None
+        memory_percent = None
+        memory_stats = stats.get("memory_stats", {})
+        if memory_stats:
+            memory_usage = memory_stats.get("usage", 0)
+            memory_limit = memory_stats.get("limit", 0)
+            
+            if memory_limit and memory_limit > 0:
+                memory_percent = round((memory_usage / memory_limit) * 100.0, 2)
+        
+        return cpu_percent, memory_usage, memory_limit, memory_percent
+
+    def _cpu_percent(self, stats: Dict) -> Optional[float]:
+        """
+        Calculate CPU usage percentage from a stats sample.
+        
+        Uses the sample's own precpu_stats, or the previous sample seen when those
+        are empty (one-shot samples).
+        """
+        cpu_stats = stats.get("cpu_stats", {})
+        cpu_usage = cpu_stats.get("cpu_usage", {})
+        if not cpu_usage:
+            return None
+        
+        total_usage = cpu_usage.get("total_usage", 0)
+        system_usage = cpu_stats.get("system_cpu_usage", 0)
+        precpu_stats = stats.get("precpu_stats", {})
+        previous = (precpu_stats.get("cpu_usage", {}).get("total_usage", 0),
+                    precpu_stats.get("system_cpu_usage", 0))
+        if not previous[1]:
+            previous = self._prev_cpu
+        self._prev_cpu = (total_usage, system_usage)
+        if previous is None:
+            return None
+        
+        cpu_delta = total_usage - previous[0]
+        system_delta = system_usage - previous[1]
+        if system_delta > 0 and cpu_delta > 0:
+            # Get number of CPUs; it doesn't change for a container, so work it out once.
+            # percpu_usage is missing on cgroup v2 hosts, where online_cpus is the answer
+            num_cpus = self._num_cpus
+            if num_cpus is None:
+                num_cpus = cpu_stats.get("online_cpus") or len(cpu_usage.get("percpu_usage") or ()) or 1
+                self._num_cpus = num_cpus
+            return round((cpu_delta / system_delta) * num_cpus * 100.0, 2)
+        return None
+
+    def _current_version(self, container) -> str:
+        """
+        Work out the n8n version a container runs from its image tags or labels.
+        
+        Resolved versions are remembered by image ID, which only changes when the
+        container is recreated, so steady-state status reads skip the image inspect.
+        """
+        image_id = container.attrs.get("Image")
+        cached = self._image_versions.get(image_id)
+        if cached:
+            return cached
+        
+        # Extract version from image tags; container.image is an API call, so read it once
+        image = container.image
+        image_tags = image.tags
+        current_version = "unknown"
+        for tag in image_tags:
+            if self.image_name in tag:
+                # Extract version from tag like "n8nio/n8n:1.0.0"
+                parts = tag.split(":")
+                if len(parts) == 2:
+                    current_version = parts[1]
+                break
+        
+        # If version is "latest", try to get actual version from image labels or inspect
+        if current_version == "latest":
+            try:
+                image_attrs = image.attrs
+                # Get labels from image attributes
+                labels = image_attrs.get("Config", {}).get("Labels", {})
+                # Try multiple possible label keys for version
+                version_label = (
+                    labels.get("org.opencontainers.image.version") or
+                    labels.get("version") or
+                    labels.get("n8n.version") or
+                    labels.get("io.n8n.version")
+                )
+                if version_label:
+                    current_version = version_label
+                else:
+                    # Try to get from image repo tags - sometimes latest points to a specific version
+                    # Check all tags for this image
+                    image_repo_tags = image_attrs.get("RepoTags", [])
+                    for repo_tag in image_repo_tags:
+                        if ":" in repo_tag and not repo_tag.endswith(":latest"):
+                            tag_part = repo_tag.split(":")[-1]
+                            # If it looks like a version number, use it
+                            if _NUMERIC_TAG_RE.match(tag_part):
+                                current_version = tag_part
+                                break
+            except Exception:
+                pass
+        
+        # "latest" and "unknown" may still resolve once the image gains a tag
+        if image_id and current_version not in ("latest", "unknown"):
+            self._image_versions[image_id] = current_version
+        return current_version
+
+    def _get_version_and_state(self) -> Tuple[str, Optional[str]]:
+        """
+        Get the container's state and n8n version without reading its stats.
+        
+        Returns:
+            Tuple of (status, current_version); ("not_found", None) if there is no container
+        """
+        try:
+            container = self._get_container()
+        except docker.errors.NotFound:
+            return "not_found", None
+        return container.status, self._current_version(container)
+
+    def _ensure_stats_stream(self, container) -> None:
+        """Start a background stats reader for container unless one is already running."""
+        with self._stats_lock:
+            if (self._stats_thread is not None and self._stats_thread.is_alive()
+                    and self._stats_container_id == container.id):
+                return
+            # A reader still following a previous container exits at its next sample
+            self._stats_stop.set()
+            self._stats_stop = threading.Event()
+            self._latest_usage = None
+            if self._stats_container_id != container.id:
+                self._num_cpus = None
+            self._stats_container_id = container.id
+            self._stats_thread = threading.Thread(
+                target=self._read_stats, args=(container, self._stats_stop), daemon=True
+            )
+            self._stats_thread.start()
+
+    def _read_stats(self, container, stop: threading.Event) -> None:
+        """Keep _latest_usage current from container's stats stream until it ends or stop is set."""
+        try:
+            for stats in container.stats(stream=True, decode=True):
+                if stop.is_set():
+                    return
+                self._latest_usage = self._usage_from_stats(stats)
+        except Exception:
+            pass
+        # The stream ends when the container stops; don't leave its last sample behind
+        if not stop.is_set():
+            self._latest_usage = None
+
+    def _stop_stats_stream(self) -> None:
+        """Stop the background stats reader; it exits at its next sample."""
+        with self._stats_lock:
+            self._stats_stop.set()
+            self._stats_container_id = None
+            self._latest_usage = None
+
     def backup_volume(self, backup_dir: str = "/app/backups") -> str:
         """
         Create a backup of the n8n_data volume.
@@ -320,8 +837,7 @@ class N8NManager:
         warnings = []
         
         try:
-            status = self.get_container_status()
-            current_version = status.get("current_version")
+            _, current_version = self._get_version_and_state()
             
             if not current_version or current_version == "unknown":
                 return {
@@ -329,19 +845,21 @@ class N8NManager:
                     "warnings": ["Current version unknown, proceeding with caution"]
                 }
             
-            current = semver.Version.parse(current_version)
-            target = semver.Version.parse(target_version)
+            current = _version_key(current_version)
+            target = _version_key(target_version)
+            current_major, current_minor, _ = current
+            target_major, target_minor, _ = target
             
             # Check for major version jump
-            if target.major > current.major:
+            if target_major > current_major:
                 warnings.append(
                     f"Major version jump detected: {current_version} -> {target_version}. "
                     "Please review n8n release notes for breaking changes."
                 )
             
             # Check for large version gap
-            if target.major == current.major:
-                minor_diff = target.minor - current.minor
+            if target_major == current_major:
+                minor_diff = target_minor - current_minor
                 if minor_diff > 10:
                     warnings.append(
                         f"Large version gap detected ({minor_diff} minor versions). "
@@ -377,66 +895,34 @@ class N8NManager:
             New container ID
         """
         try:
+            # Pull new image first, while the current container keeps serving, unless
+            # this exact tag is already local (e.g. on rollback). Moving tags are always
+            # pulled so they pick up new releases
+            image_tag = f"{self.image_name}:{target_version}"
+            if target_version in ("latest", "next") or not self._has_local_image(image_tag):
+                if callback:
+                    callback(f"Pulling image n8nio/n8n:{target_version}...")
+                self._pull_image(target_version, callback)
+            elif callback:
+                callback(f"Using local image n8nio/n8n:{target_version}...")
+            
             if callback:
                 callback("Getting current container configuration...")
             
             # Get current container configuration
-            ports_config = None
-            volumes_config = None
-            network_config = None
-            env_dict = {}
+            snapshot = ContainerSnapshot()
             
             try:
-                container = self.client.containers.get(self.container_name)
-                config = container.attrs.get("Config", {})
-                host_config = container.attrs.get("HostConfig", {})
-                env_vars = config.get("Env", [])
-                
-                # Parse environment variables
-                for env in env_vars:
-                    if "=" in env:
-                        key, value = env.split("=", 1)
-                        env_dict[key] = value
-                
-                # Extract port bindings
-                port_bindings = host_config.get("PortBindings", {})
-                if port_bindings:
-                    ports_config = {}
-                    for container_port, host_bindings in port_bindings.items():
-                        if host_bindings:
-                            # Extract port number from "5678/tcp" format if needed
-                            port_num = container_port
-                            if isinstance(container_port, str) and "/" in container_port:
-                                port_num = int(container_port.split("/")[0])
-                            ports_config[port_num] = int(host_bindings[0]["HostPort"])
-                
-                # Extract volume mounts
-                mounts = host_config.get("Mounts", [])
-                if mounts:
-                    volumes_config = {}
-                    for mount in mounts:
-                        if mount.get("Type") == "volume":
-                            # Handle both "Destination" and "destination" keys
-                            destination = mount.get("Destination") or mount.get("destination")
-                            mount_name = mount.get("Name")
-                            if mount_name and destination:
-                                volumes_config[mount_name] = {
-                                    "bind": destination,
-                                    "mode": mount.get("Mode", mount.get("mode", "rw"))
-                                }
-                
-                # Extract network information
-                network_settings = container.attrs.get("NetworkSettings", {})
-                networks = network_settings.get("Networks", {})
-                if networks:
-                    # Get the first network (usually the main one)
-                    network_config = list(networks.keys())[0]
-                
-                if callback:
-                    callback("Stopping current container...")
+                container = self._get_container()
+                snapshot = self._snapshot_container(container)
                 
-                # Stop container
-                container.stop(timeout=60)
+                # Stop container, unless it already isn't running (e.g. it crashed);
+                # paused and restarting containers still need stopping before removal
+                self._stop_stats_stream()
+                if container.status not in ("created", "exited", "dead"):
+                    if callback:
+                        callback("Stopping current container...")
+                    container.stop(timeout=60)
                 
                 if callback:
                     callback("Removing old container...")
@@ -446,103 +932,51 @@ class N8NManager:
             except docker.errors.NotFound:
                 if callback:
                     callback("Container not found, creating new one...")
-                # Use defaults if container doesn't exist
-                ports_config = {5678: 5678}
-                volumes_config = {"n8n_data": {"bind": "/home/node/.n8n", "mode": "rw"}}
-            
-            if callback:
-                callback(f"Pulling image n8nio/n8n:{target_version}...")
-            
-            # Pull new image
-            image_tag = f"{self.image_name}:{target_version}"
-            self.client.images.pull(image_tag)
+                # Defaults are filled in below
             
             if callback:
                 callback("Creating new container...")
             
-            # Prepare port bindings in the correct format for host_config
-            # Format: {container_port: host_port} - simple integer mapping
-            port_bindings_dict = {}
-            ports_list = []
-            if ports_config:
-                for container_port, host_port in ports_config.items():
-                    # Extract port number if it's in "5678/tcp" format
-                    if isinstance(container_port, str) and "/" in container_port:
-                        container_port = int(container_port.split("/")[0])
-                    port_bindings_dict[int(container_port)] = int(host_port)
-                    ports_list.append(int(container_port))
-            else:
-                port_bindings_dict[5678] = 5678
-                ports_list = [5678]
-            
-            # Convert env_dict back to list format
-            env_list = [f"{k}={v}" for k, v in env_dict.items()]
-            
-            # Use volumes format expected by docker-py
-            # Format: {volume_name: {"bind": mount_point, "mode": "rw"}}
-            volumes = volumes_config or {"n8n_data": {"bind": "/home/node/.n8n", "mode": "rw"}}
-            
-            # Ensure volumes dict is properly formatted
-            if not volumes or not isinstance(volumes, dict):
-                volumes = {"n8n_data": {"bind": "/home/node/.n8n", "mode": "rw"}}
+            # Fall back to n8n's defaults for anything the old container didn't have
+            port_bindings = snapshot.port_bindings or {5678: 5678}
+            binds = snapshot.binds or {"n8n_data": "/home/node/.n8n"}
             
-            # Validate volumes format
-            validated_volumes = {}
-            for vol_name, vol_config in volumes.items():
-                if isinstance(vol_config, dict) and "bind" in vol_config:
-                    validated_volumes[vol_name] = vol_config
-                else:
-                    # If format is wrong, use default
-                    validated_volumes[vol_name] = {"bind": "/home/node/.n8n", "mode": "rw"}
+            # Convert env back to list format
+            env_list = [f"{k}={v}" for k, v in snapshot.env.items()]
             
             # Use the low-level API to create container with proper host_config
             # The high-level containers.create() doesn't accept host_config in newer docker-py versions
             host_config_dict = self.client.api.create_host_config(
-                port_bindings=port_bindings_dict,
+                port_bindings=port_bindings,
                 restart_policy={"Name": "unless-stopped"},
-                binds={vol_name: vol_config["bind"] for vol_name, vol_config in validated_volumes.items()}
+                binds=binds
             )
             
-            # Prepare volumes list for create_container
-            # Format: list of mount points
-            volumes_list = [vol_config["bind"] for vol_config in validated_volumes.values()]
-            
             # Create container using low-level API
             # The API expects image as first param, not in a config dict
             container_response = self.client.api.create_container(
                 image=image_tag,
                 name=self.container_name,
-                ports=ports_list,
+                ports=list(port_bindings),
                 host_config=host_config_dict,
                 environment=env_list,
-                volumes=volumes_list
+                volumes=list(binds.values())
             )
             
             # Get the container object from the response
             new_container = self.client.containers.get(container_response["Id"])
+            self._container_id = new_container.id
             
             # Connect to network if specified
-            if network_config:
-                try:
-                    network = self.client.networks.get(network_config)
-                    network.connect(new_container)
-                except Exception:
-                    # If network connection fails, try to find network by container name pattern
-                    # This handles docker-compose network naming (project_name_web)
-                    all_networks = self.client.networks.list()
-                    for net in all_networks:
-                        if "web" in net.name.lower() or network_config in net.name:
-                            try:
-                                net.connect(new_container)
-                                break
-                            except Exception:
-                                continue
+            if snapshot.network:
+                self._connect_network(new_container, snapshot.network)
             
             if callback:
                 callback("Starting new container...")
             
             # Start container
             new_container.start()
+            self._status_cache = None
             
             if callback:
                 callback("Upgrade complete!")
@@ -551,17 +985,108 @@ class N8NManager:
         except Exception as e:
             raise Exception(f"Failed to update container: {str(e)}")
 
-    def rollback_to_previous(self) -> str:
+    def _connect_network(self, container, network_name: str):
+        """
+        Connect container to network_name, or failing that to a "web" network.
+        
+        The fallback handles docker-compose network naming (project_name_web).
+        Connection failures are ignored, as the container still runs without it.
+        """
+        network_id = self._network_ids.get(network_name)
+        if network_id:
+            try:
+                self.client.api.connect_container_to_network(container.id, network_id)
+                return
+            except Exception:
+                self._network_ids.pop(network_name, None)
+        
+        # The daemon matches name filters as substrings, so a single call returns the
+        # network itself and any compose-prefixed candidates; try an exact match first
+        candidates = self.client.networks.list(filters={"name": [network_name, "web"]})
+        candidates.sort(key=lambda net: net.name != network_name)
+        for net in candidates:
+            try:
+                net.connect(container)
+                self._network_ids[network_name] = net.id
+                return
+            except Exception:
+                continue
+
+    def _pull_image(self, target_version: str, callback: Optional[Callable] = None):
+        """
+        Pull n8nio/n8n:target_version, reporting per-layer progress through callback.
+        
+        Raises:
+            Exception: If the daemon reports an error in the pull stream
+        """
+        stream = self.client.api.pull(self.image_name, tag=target_version, stream=True, decode=True)
+        for event in stream:
+            if "error" in event:
+                raise Exception(event["error"])
+            if callback:
+                # e.g. "a1b2c3d4e5f6: Downloading [=====>   ] 12.3MB/45.6MB"
+                detail = " ".join(filter(None, (event.get("status"), event.get("progress"))))
+                layer = event.get("id")
+                callback(f"Pulling image n8nio/n8n:{target_version}: {layer}: {detail}" if layer
+                         else f"Pulling image n8nio/n8n:{target_version}: {detail}")
+
+    def _has_local_image(self, image_tag: str) -> bool:
+        """Check whether image_tag is already present locally."""
+        try:
+            self.client.images.get(image_tag)
+            return True
+        except docker.errors.ImageNotFound:
+            return False
+
+    @staticmethod
+    def _snapshot_container(container) -> ContainerSnapshot:
+        """Read the settings a replacement container needs from container.attrs in one pass."""
+        attrs = container.attrs
+        host_config = attrs.get("HostConfig", {})
+        
+        # Parse environment variables; partition() scans each entry once, and entries
+        # without "=" (empty separator) are skipped
+        env_dict = {
+            key: value
+            for key, separator, value in (env.partition("=") for env in attrs.get("Config", {}).get("Env") or [])
+            if separator
+        }
+        
+        # Extract port bindings, taking the port number from "5678/tcp" format
+        port_bindings = {
+            int(str(container_port).split("/")[0]): int(host_bindings[0]["HostPort"])
+            for container_port, host_bindings in (host_config.get("PortBindings") or {}).items()
+            if host_bindings
+        }
+        
+        # Extract volume mounts, handling both "Destination" and "destination" keys
+        binds = {}
+        for mount in host_config.get("Mounts") or []:
+            if mount.get("Type") == "volume":
+                destination = mount.get("Destination") or mount.get("destination")
+                mount_name = mount.get("Name")
+                if mount_name and destination:
+                    binds[mount_name] = destination
+        
+        # Get the first network (usually the main one)
+        networks = attrs.get("NetworkSettings", {}).get("Networks", {})
+        network_config = next(iter(networks), None)
+        
+        return ContainerSnapshot(port_bindings=port_bindings, binds=binds, env=env_dict, network=network_config)
+
+    def rollback_to_previous(self, callback: Optional[Callable] = None) -> str:
         """
         Rollback to the previous version by using the first local image that's different from current.
         
+        Args:
+            callback: Optional function to report progress (message: str)
+            
         Returns:
             New container ID
         """
         try:
             # Get current container status to check current version
-            current_status = self.get_container_status()
-            current_version = current_status.get("current_version")
+            _, current_version = self._get_version_and_state()
             
             images = self.get_local_images()
             if len(images) < 2:
@@ -589,7 +1114,7 @@ class N8NManager:
             if rollback_version == current_version:
                 raise Exception(f"Already running version {rollback_version}. Cannot rollback to the same version.")
             
-            return self.update_to_version(rollback_version)
+            return self.update_to_version(rollback_version, callback=callback)
         except Exception as e:
             raise Exception(f"Failed to rollback: {str(e)}")
 
@@ -602,60 +1127,59 @@ class N8NManager:
         """
         try:
             images = self.client.images.list(name=self.image_name)
+            # (sort key, image) pairs
             result = []
             
             for image in images:
-                for tag in image.tags:
-                    if self.image_name in tag:
-                        parts = tag.split(":")
-                        if len(parts) == 2:
-                            version = parts[1]
-                            created = image.attrs.get("Created", "")
-                            
-                            # If version is "latest", try to resolve to actual version
-                            if version == "latest":
-                                try:
-                                    # Get labels from image attributes
-                                    labels = image.attrs.get("Config", {}).get("Labels", {})
-                                    # Try multiple possible label keys for version
-                                    version_label = (
-                                        labels.get("org.opencontainers.image.version") or
-                                        labels.get("version") or
-                                        labels.get("n8n.version") or
-                                        labels.get("io.n8n.version")
-                                    )
-                                    if version_label:
-                                        version = version_label
-                                    else:
-                                        # Try to get from image repo tags - sometimes latest points to a specific version
-                                        image_repo_tags = image.attrs.get("RepoTags", [])
-                                        for repo_tag in image_repo_tags:
-                                            if ":" in repo_tag and not repo_tag.endswith(":latest"):
-                                                tag_part = repo_tag.split(":")[-1]
-                                                # If it looks like a version number, use it
-                                                if tag_part and tag_part.replace(".", "").replace("-", "").isdigit():
-                                                    version = tag_part
-                                                    break
-                                except Exception:
-                                    pass  # Keep "latest" if we can't resolve it
-                            
-                            result.append({
-                                "version": version,
-                                "created": created
-                            })
-                            break
+                # Every tag on an image shares its ID, so a "latest" tag resolves to any
+                # versioned tag alongside it without rescanning RepoTags
+                versions = [
+                    parts[1]
+                    for parts in (tag.split(":") for tag in image.tags if self.image_name in tag)
+                    if len(parts) == 2
+                ]
+                if not versions:
+                    continue
+                # Moving tags (latest, next, beta...) don't say which release this is,
+                # so only a plain X.Y.Z sibling counts as the version
+                version = next((v for v in versions if _fast_parse(v) is not None), None)
+                
+                image_attrs = image.attrs
+                
+                # Only an image without a release tag needs its labels read
+                if version is None:
+                    version = "latest" if "latest" in versions else versions[0]
+                    try:
+                        labels = image_attrs.get("Config", {}).get("Labels") or {}
+                        # Try multiple possible label keys for version
+                        version = (
+                            labels.get("org.opencontainers.image.version") or
+                            labels.get("version") or
+                            labels.get("n8n.version") or
+                            labels.get("io.n8n.version") or
+                            version
+                        )
+                    except Exception:
+                        pass  # Keep the tag if we can't resolve it
+                
+                created = image_attrs.get("Created", "")
+                result.append((_created_key(created), {
+                    "version": version,
+                    "created": created
+                }))
             
             # Sort by creation date descending
-            result.sort(key=lambda x: x["created"], reverse=True)
-            return result
+            result.sort(key=itemgetter(0), reverse=True)
+            return [image for _, image in result]
         except Exception as e:
             raise Exception(f"Failed to get local images: {str(e)}")
 
     def start_container(self):
         """Start the n8n container."""
         try:
-            container = self.client.containers.get(self.container_name)
+            container = self._get_container()
             container.start()
+            self._status_cache = None
         except docker.errors.NotFound:
             raise Exception("Container not found")
         except Exception as e:
@@ -664,8 +1188,10 @@ class N8NManager:
     def stop_container(self):
         """Stop the n8n container."""
         try:
-            container = self.client.containers.get(self.container_name)
+            container = self._get_container()
+            self._stop_stats_stream()
             container.stop(timeout=60)
+            self._status_cache = None
         except docker.errors.NotFound:
             raise Exception("Container not found")
         except Exception as e:
@@ -674,8 +1200,9 @@ class N8NManager:
     def restart_container(self):
         """Restart the n8n container."""
         try:
-            container = self.client.containers.get(self.container_name)
+            container = self._get_container()
             container.restart(timeout=60)
+            self._status_cache = None
         except docker.errors.NotFound:
             raise Exception("Container not found")
         except Exception as e:
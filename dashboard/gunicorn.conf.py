@@ -0,0 +1,18 @@
+# gunicorn server hooks; the command-line settings live in the Dockerfile CMD.
+# gunicorn loads ./gunicorn.conf.py from the working directory automatically.
+import signal
+
+
+def post_worker_init(worker):
+    """End the dashboard's status streams as soon as the worker is told to stop."""
+    from app import begin_shutdown
+
+    handle_exit = worker.handle_exit
+
+    def handle_exit_and_end_streams(sig, frame):
+        # Without this a single open dashboard tab keeps its SSE request alive
+        # until the graceful timeout runs out and the worker is killed
+        begin_shutdown()
+        handle_exit(sig, frame)
+
+    signal.signal(signal.SIGTERM, handle_exit_and_end_streams)
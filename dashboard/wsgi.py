@@ -0,0 +1,6 @@
+# Patch the standard library before anything imports sockets or threading, so
+# blocking Docker/HTTP calls yield to other requests instead of holding the worker
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402